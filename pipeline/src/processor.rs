@@ -31,7 +31,7 @@ impl TelemetryProcessor {
         let process_start = Instant::now();
 
         // Zero-copy decode only parse what we need
-        let mut fast_telemetry = FastTelemetry::new(&data);
+        let fast_telemetry = FastTelemetry::new(&data);
 
         // only decode critical fields for processing
         let packet_id = fast_telemetry
@@ -1,291 +1,119 @@
 //! F1 Telemetry packet definitions
 use serde::{Deserialize, Serialize};
 
-/// zero-copy telemetry decoder that reads directly from bytes
+/// size of the fixed little-endian wire layout produced by the Python streamer
+/// (src/telemetry_packet.py, struct format `<QIBHBBbbH?BBB4H4BHHH`)
+pub const PACKET_SIZE: usize = 43;
+
+// byte offsets of each field in the wire layout
+const OFF_T: usize = 0; // u64
+const OFF_ID: usize = 8; // u32
+const OFF_P: usize = 12; // u8
+const OFF_SPD: usize = 13; // u16
+const OFF_THR: usize = 15; // u8, 1/255
+const OFF_BRK: usize = 16; // u8, 1/255
+const OFF_STR: usize = 17; // i8, 1/127
+const OFF_G: usize = 18; // i8
+const OFF_RPM: usize = 19; // u16
+const OFF_DRS: usize = 21; // bool
+const OFF_OILP: usize = 22; // u8, 0.1 bar
+const OFF_OILT: usize = 23; // u8
+const OFF_H2OT: usize = 24; // u8
+const OFF_TP: usize = 25; // 4 x u16, 0.01 psi
+const OFF_TT: usize = 33; // 4 x u8
+const OFF_ERS: usize = 37; // u16, kJ
+const OFF_MGUK: usize = 39; // u16, 10 W
+const OFF_FUEL: usize = 41; // u16, 0.01 kg/h
+
+// fixed-point scales, value = raw / scale (must match telemetry_packet.py)
+const THROTTLE_SCALE: f64 = 255.0;
+const BRAKE_SCALE: f64 = 255.0;
+const STEERING_SCALE: f64 = 127.0;
+const OIL_PRESSURE_SCALE: f64 = 10.0;
+const TYRE_PRESSURE_SCALE: f64 = 100.0;
+const ERS_STORE_SCALE: f64 = 0.001;
+const MGUK_POWER_SCALE: f64 = 0.1;
+const FUEL_FLOW_SCALE: f64 = 100.0;
+
+/// zero-copy telemetry decoder that reads fields at fixed offsets
 pub struct TelemetryDecoder<'a> {
     data: &'a [u8],
-    cursor: usize,
 }
 
 impl<'a> TelemetryDecoder<'a> {
     pub fn new(data: &'a [u8]) -> Self {
-        Self { data, cursor: 0 }
+        Self { data }
     }
 
-    /// read MessagePack format marker
-    fn read_marker(&mut self) -> Result<u8, &'static str> {
-        if self.cursor >= self.data.len() {
-            return Err("Buffer underflow");
-        }
-        let marker = self.data[self.cursor];
-        self.cursor += 1;
-        Ok(marker)
+    /// borrow N bytes at offset without copying the packet
+    fn bytes<const N: usize>(&self, offset: usize) -> Result<[u8; N], &'static str> {
+        self.data
+            .get(offset..offset + N)
+            .and_then(|b| b.try_into().ok())
+            .ok_or("Buffer underflow")
     }
 
-    /// skip a field without deserializing
-    fn skip_field(&mut self) -> Result<(), &'static str> {
-        let marker = self.read_marker()?;
-
-        match marker {
-            // +ve fixint (0x00-0x7f)
-            0x00..=0x7f => Ok(()),
-            // Fixmap (0x80-0x8f)
-            0x80..=0x8f => {
-                let len = (marker & 0x0f) as usize;
-                for _ in 0..len * 2 {
-                    self.skip_field()?;
-                }
-                Ok(())
-            }
-            // Fixarray (0x90-0x9f)
-            0x90..=0x9f => {
-                let len = (marker & 0x0f) as usize;
-                for _ in 0..len {
-                    self.skip_field()?;
-                }
-                Ok(())
-            }
-            // Fixstr (0xa0-0xbf)
-            0xa0..=0xbf => {
-                let len = (marker & 0x1f) as usize;
-                self.cursor += len;
-                Ok(())
-            }
-            // nil, false, true
-            0xc0 | 0xc2 | 0xc3 => Ok(()),
-            // float32
-            0xca => {
-                self.cursor += 4;
-                Ok(())
-            }
-            // float64
-            0xcb => {
-                self.cursor += 8;
-                Ok(())
-            }
-            // uint8
-            0xcc => {
-                self.cursor += 1;
-                Ok(())
-            }
-            // uint16
-            0xcd => {
-                self.cursor += 2;
-                Ok(())
-            }
-            // uint32
-            0xce => {
-                self.cursor += 4;
-                Ok(())
-            }
-            // uint64
-            0xcf => {
-                self.cursor += 8;
-                Ok(())
-            }
-            // int8
-            0xd0 => {
-                self.cursor += 1;
-                Ok(())
-            }
-            // int16
-            0xd1 => {
-                self.cursor += 2;
-                Ok(())
-            }
-            // int32
-            0xd2 => {
-                self.cursor += 4;
-                Ok(())
-            }
-            // int64
-            0xd3 => {
-                self.cursor += 8;
-                Ok(())
-            }
-            // str8
-            0xd9 => {
-                let len = self.data[self.cursor] as usize;
-                self.cursor += 1 + len;
-                Ok(())
-            }
-            // -ve fixint (0xe0-0xff)
-            0xe0..=0xff => Ok(()),
-            _ => Err("Unknown MessagePack marker"),
-        }
+    pub fn read_u8(&self, offset: usize) -> Result<u8, &'static str> {
+        Ok(self.bytes::<1>(offset)?[0])
     }
 
-    /// read u64 directly from bytes
-    pub fn read_u64(&mut self) -> Result<u64, &'static str> {
-        let marker = self.read_marker()?;
-
-        match marker {
-            // +ve fixint
-            0x00..=0x7f => Ok(marker as u64),
-            // uint8
-            0xcc => {
-                let val = self.data[self.cursor];
-                self.cursor += 1;
-                Ok(val as u64)
-            }
-            // uint16
-            0xcd => {
-                let val = u16::from_be_bytes([self.data[self.cursor], self.data[self.cursor + 1]]);
-                self.cursor += 2;
-                Ok(val as u64)
-            }
-            // uint32
-            0xce => {
-                let val = u32::from_be_bytes([
-                    self.data[self.cursor],
-                    self.data[self.cursor + 1],
-                    self.data[self.cursor + 2],
-                    self.data[self.cursor + 3],
-                ]);
-                self.cursor += 4;
-                Ok(val as u64)
-            }
-            // uint64
-            0xcf => {
-                let val = u64::from_be_bytes([
-                    self.data[self.cursor],
-                    self.data[self.cursor + 1],
-                    self.data[self.cursor + 2],
-                    self.data[self.cursor + 3],
-                    self.data[self.cursor + 4],
-                    self.data[self.cursor + 5],
-                    self.data[self.cursor + 6],
-                    self.data[self.cursor + 7],
-                ]);
-                self.cursor += 8;
-                Ok(val)
-            }
-            _ => Err("Expected integer"),
-        }
+    pub fn read_i8(&self, offset: usize) -> Result<i8, &'static str> {
+        Ok(i8::from_le_bytes(self.bytes(offset)?))
     }
 
-    /// read u16 without allocation
-    pub fn read_u16(&mut self) -> Result<u16, &'static str> {
-        let val = self.read_u64()?;
-        Ok(val as u16)
+    pub fn read_u16(&self, offset: usize) -> Result<u16, &'static str> {
+        Ok(u16::from_le_bytes(self.bytes(offset)?))
     }
 
-    /// read priority field
-    pub fn read_priority(&mut self) -> Result<u8, &'static str> {
-        let val = self.read_u64()?;
-        Ok(val as u8)
+    pub fn read_u32(&self, offset: usize) -> Result<u32, &'static str> {
+        Ok(u32::from_le_bytes(self.bytes(offset)?))
     }
 
-    /// navigate to specific field in map without full deserialization
-    pub fn find_field(&mut self, target_key: &str) -> Result<bool, &'static str> {
-        // reset to start for simplicity
-        self.cursor = 0;
-
-        // read map header
-        let marker = self.read_marker()?;
-        let map_len = match marker {
-            0x80..=0x8f => (marker & 0x0f) as usize,
-            0xde => {
-                let len = u16::from_be_bytes([self.data[self.cursor], self.data[self.cursor + 1]]);
-                self.cursor += 2;
-                len as usize
-            }
-            _ => return Err("Not a map"),
-        };
-
-        // scan through map entries
-        for _ in 0..map_len {
-            // check if this key matches
-            let key_start = self.cursor;
-            let key_marker = self.data[self.cursor];
-
-            if key_marker >= 0xa0 && key_marker <= 0xbf {
-                // fixstr
-                let key_len = (key_marker & 0x1f) as usize;
-                self.cursor += 1;
+    pub fn read_u64(&self, offset: usize) -> Result<u64, &'static str> {
+        Ok(u64::from_le_bytes(self.bytes(offset)?))
+    }
 
-                if key_len == target_key.len() {
-                    let key_bytes = &self.data[self.cursor..self.cursor + key_len];
-                    if key_bytes == target_key.as_bytes() {
-                        self.cursor += key_len;
-                        return Ok(true);
-                    }
-                }
-                self.cursor = key_start;
-            }
+    /// read a fixed-point u8 and scale it back to its real value
+    pub fn read_scaled_u8(&self, offset: usize, scale: f64) -> Result<f32, &'static str> {
+        Ok((self.read_u8(offset)? as f64 / scale) as f32)
+    }
 
-            // skip this key
-            self.skip_field()?;
-            // skip the value
-            self.skip_field()?;
-        }
+    /// read a fixed-point i8 and scale it back to its real value
+    pub fn read_scaled_i8(&self, offset: usize, scale: f64) -> Result<f32, &'static str> {
+        Ok((self.read_i8(offset)? as f64 / scale) as f32)
+    }
 
-        Ok(false)
+    /// read a fixed-point u16 and scale it back to its real value
+    pub fn read_scaled_u16(&self, offset: usize, scale: f64) -> Result<f32, &'static str> {
+        Ok((self.read_u16(offset)? as f64 / scale) as f32)
     }
 }
 
 /// minimal telemetry data for critical fields only
 pub struct FastTelemetry<'a> {
     decoder: TelemetryDecoder<'a>,
-    // cache essential fields
-    packet_id: Option<u32>,
-    priority: Option<u8>,
-    speed: Option<u16>,
 }
 
 impl<'a> FastTelemetry<'a> {
     pub fn new(data: &'a [u8]) -> Self {
         Self {
             decoder: TelemetryDecoder::new(data),
-            packet_id: None,
-            priority: None,
-            speed: None,
         }
     }
 
-    /// get packet ID with lazy parsing
-    pub fn packet_id(&mut self) -> Result<u32, &'static str> {
-        if let Some(id) = self.packet_id {
-            return Ok(id);
-        }
-
-        if self.decoder.find_field("id")? {
-            let id = self.decoder.read_u64()? as u32;
-            self.packet_id = Some(id);
-            Ok(id)
-        } else {
-            Err("Packet ID field not found")
-        }
+    /// get packet ID straight from its offset
+    pub fn packet_id(&self) -> Result<u32, &'static str> {
+        self.decoder.read_u32(OFF_ID)
     }
 
-    /// get priority with lazy parsing
-    pub fn priority(&mut self) -> Result<u8, &'static str> {
-        if let Some(p) = self.priority {
-            return Ok(p);
-        }
-
-        if self.decoder.find_field("p")? {
-            let p = self.decoder.read_priority()?;
-            self.priority = Some(p);
-            Ok(p)
-        } else {
-            Ok(1) // default priority
-        }
+    /// get priority straight from its offset
+    pub fn priority(&self) -> Result<u8, &'static str> {
+        self.decoder.read_u8(OFF_P)
     }
 
-    /// get speed with lazy parsing (for load simulation)
-    pub fn speed(&mut self) -> Result<u16, &'static str> {
-        if let Some(spd) = self.speed {
-            return Ok(spd);
-        }
-
-        if self.decoder.find_field("spd")? {
-            let spd = self.decoder.read_u16()?;
-            self.speed = Some(spd);
-            Ok(spd)
-        } else {
-            Err("Speed field not found")
-        }
+    /// get speed straight from its offset (for load simulation)
+    pub fn speed(&self) -> Result<u16, &'static str> {
+        self.decoder.read_u16(OFF_SPD)
     }
 }
 
@@ -312,7 +140,35 @@ pub struct TelemetryPacket {
 }
 
 impl TelemetryPacket {
-    pub fn from_bytes(data: &[u8]) -> Result<Self, rmp_serde::decode::Error> {
-        rmp_serde::from_slice(data)
+    pub fn from_bytes(data: &[u8]) -> Result<Self, &'static str> {
+        if data.len() < PACKET_SIZE {
+            return Err("Packet too short");
+        }
+
+        let d = TelemetryDecoder::new(data);
+        Ok(Self {
+            t: d.read_u64(OFF_T)?,
+            id: d.read_u32(OFF_ID)?,
+            p: d.read_u8(OFF_P)?,
+            spd: d.read_u16(OFF_SPD)?,
+            thr: d.read_scaled_u8(OFF_THR, THROTTLE_SCALE)?,
+            brk: d.read_scaled_u8(OFF_BRK, BRAKE_SCALE)?,
+            str: d.read_scaled_i8(OFF_STR, STEERING_SCALE)?,
+            g: d.read_i8(OFF_G)?,
+            rpm: d.read_u16(OFF_RPM)?,
+            drs: d.read_u8(OFF_DRS)? != 0,
+            oilp: d.read_scaled_u8(OFF_OILP, OIL_PRESSURE_SCALE)?,
+            oilt: d.read_u8(OFF_OILT)? as i16,
+            h2ot: d.read_u8(OFF_H2OT)? as i16,
+            tp: (0..4)
+                .map(|i| d.read_scaled_u16(OFF_TP + i * 2, TYRE_PRESSURE_SCALE))
+                .collect::<Result<_, _>>()?,
+            tt: (0..4)
+                .map(|i| d.read_u8(OFF_TT + i).map(i16::from))
+                .collect::<Result<_, _>>()?,
+            ers: d.read_scaled_u16(OFF_ERS, ERS_STORE_SCALE)?,
+            mguk: d.read_scaled_u16(OFF_MGUK, MGUK_POWER_SCALE)?,
+            fuel: d.read_scaled_u16(OFF_FUEL, FUEL_FLOW_SCALE)?,
+        })
     }
 }
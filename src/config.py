@@ -4,9 +4,20 @@ BASE_FREQUENCY_HZ = 500  # F1 game uses 20-60 Hz
 # UDP Configs
 UDP_PORT = 20777  # same as F1 game
 UDP_PACKET_SIZE = 512
+PACKET_BATCH_SIZE = 64  # packets per generator step handed to the socket
+MAX_SEND_BATCH = 100  # datagrams per sendmmsg call
+PREFETCH_BATCHES = 16  # packed batches queued ahead of the send loop
+USE_UDP_GSO = True  # one segmented send per batch where the kernel supports UDP_SEGMENT
+SEND_FLUSH_SLACK_US = 100  # flush queued packets when the next send is further away than this
+SOCKET_SNDBUF_BYTES = 4 * 1024 * 1024
+SOCKET_BUSY_POLL_US = 0  # opt-in, busy polling only affects receives so this send-only socket gains nothing
+WARN_RING_SIZE = 256  # send path warnings kept between metrics ticks
+WARN_PRINT_LIMIT = 20  # printed per tick, the rest are counted
 
 # timing constraints
 MAX_LATENCY_MS = 10  # =<10ms end2end
+LATENCY_SATURATION_US = 65535  # uint16 range, larger latencies are clamped and counted
+LATENCY_SAMPLE_EVERY = max(1, BASE_FREQUENCY_HZ // 1000)  # latency histogram records 1 in N packets
 PACKET_INTERVAL_MS = 1000.0 / BASE_FREQUENCY_HZ  # 2ms at 500Hz
 
 # telemetry priority list
@@ -16,6 +27,12 @@ PRIORITY_CHANNELS = [
     'fuel_flow', 'ers_deployment'  # for energy management
 ]
 
+# per-packet [DEBUG]/[STREAM] lines and load diagnostics
+DEBUG_LOGGING = False
+
+# simulated sensor noise, None for a fresh seed every run
+SENSOR_NOISE_SEED = None
+
 # target 
 TARGET_CAR_NUMBER = 81
 TARGET_SESSION = 'Race'
@@ -25,4 +42,5 @@ MAX_LAPS_TO_LOAD = None
 
 DEFAULT_YEAR = 2025
 DEFAULT_RACE = 'Monza'
-CACHE_DIR = './f1_cache'
\ No newline at end of file
+CACHE_DIR = './f1_cache'
+USE_PROCESSED_CACHE = True  # reuse cleaned telemetry from CACHE_DIR between runs
\ No newline at end of file
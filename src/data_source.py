@@ -1,15 +1,35 @@
 import os
+import logging
+import zipfile
 import fastf1
 from fastf1 import Cache
 import pandas as pd
 import numpy as np
-from typing import Generator, Dict
+from typing import Generator, Dict, List
 import time
 
-from telemetry_packet import F1TelemetryPacket, PacketPriority
+from telemetry_packet import F1TelemetryPacket, PacketPriority, PACKET_SIZE_BYTES, pack_columns
 from config import *
 
+logger = logging.getLogger(__name__)
+
+# channels kept from FastF1 lap telemetry for streaming
+TELEMETRY_CHANNELS = ['Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS']
+CHANNEL_DTYPES = {
+    'Speed': np.float32,
+    'Throttle': np.float32,
+    'Brake': np.float32,
+    'RPM': np.float32,
+    'nGear': np.int16,
+    'DRS': np.int8,
+}
+
+# simulated cold tyre pressures, FL, FR, RL, RR
+TYRE_PRESSURE_PSI = (23.0, 23.0, 21.0, 21.0)
+
 class F1DataSource:
+    packet_size = PACKET_SIZE_BYTES  # every streamed packet has the fixed wire layout
+    
     def __init__(self, year: int = DEFAULT_YEAR, race: str = DEFAULT_RACE):
         self.year = year
         self.race = race
@@ -17,8 +37,16 @@ class F1DataSource:
         self.car_data = None
         self.lap_data = None
         self.packet_counter = 0
-        self.lap_boundaries = []  # start_idx, end_idx, lap_number, lap_time
+        self._boundary_arrays = None  # start_idx, end_idx (inclusive), lap_number arrays, lap_time list
+        self._lap_start_scaled = None  # lap boundaries scaled to the interpolated stream
+        self._lap_end_scaled = None
+        self._lap_cursor = 0
+        self._cols = None  # interpolated channels as contiguous arrays, keyed by name
+        self._rng = np.random.default_rng(SENSOR_NOISE_SEED)
+        self._oil_noise = None
+        self._water_noise = None
         self.current_lap = 1
+        self.current_lap_time = None
         self.total_laps = 0
         
         if not os.path.exists(CACHE_DIR):
@@ -33,108 +61,24 @@ class F1DataSource:
 
     def load_session(self, session_type: str = TARGET_SESSION) -> bool:
         try:
-            print(f"\n[LOAD] Fetching {self.year} {self.race} {session_type}...")
-            print("[LOAD] Wait for a while...")
-            
-            self.session = fastf1.get_session(self.year, self.race, session_type)
-            self.session.load(telemetry=True)
-            
-            driver_laps = self.session.laps.pick_drivers(TARGET_CAR_NUMBER)
-            
-            if driver_laps.empty:
-                print(f"[ERROR] No data for car #{TARGET_CAR_NUMBER}")
-                return False
-            
-            print(f"[INFO] Found {len(driver_laps)} laps for car #{TARGET_CAR_NUMBER}")
-            
-            if LOAD_ALL_LAPS and len(driver_laps) > 1:
-                complete_laps = driver_laps[driver_laps['LapTime'].notna()]
+            cache_path = self._processed_cache_path(session_type)
+            if USE_PROCESSED_CACHE and self._load_processed_cache(cache_path):
+                print(f"[LOAD] Using processed session cache: {cache_path}")
+            else:
+                if not self._fetch_session_telemetry(session_type):
+                    return False
                 
-                if MAX_LAPS_TO_LOAD:
-                    complete_laps = complete_laps.iloc[:MAX_LAPS_TO_LOAD]
-                    print(f"[INFO] Limited to {MAX_LAPS_TO_LOAD} laps per config")
-
-
-                telemetry_list = []
-                cumulative_time = pd.Timedelta(0)
-                cumulative_samples = 0
-
-                # Track lap boundaries
-                self.lap_boundaries = []
-                self.total_laps = len(complete_laps)
-
-                for idx, lap in complete_laps.iterrows():
-                    try:
-                        lap_telemetry = lap.get_telemetry()
-                        if lap_telemetry is not None and not lap_telemetry.empty:
-                            # time cumulative across laps
-                            lap_telemetry = lap_telemetry.copy()
-                            lap_telemetry['Time'] = lap_telemetry['Time'] + cumulative_time
-                            
-                            # store lap boundary info
-                            start_idx = cumulative_samples
-                            end_idx = cumulative_samples + len(lap_telemetry) - 1
-                            lap_info = (
-                                start_idx,
-                                end_idx,
-                                lap['LapNumber'],
-                                lap['LapTime']
-                            )
-                            self.lap_boundaries.append(lap_info)
-
-                            telemetry_list.append(lap_telemetry)
-                            # print(f"  Lap {lap['LapNumber']}: {len(lap_telemetry)} samples, "f"LapTime: {lap['LapTime']}")
-                            
-                            # update cumulative time for next lap
-                            cumulative_samples += len(lap_telemetry)
-                            if not lap_telemetry.empty:
-                                cumulative_time = lap_telemetry['Time'].iloc[-1]
-                    except Exception as e:
-                        print(f"  Warning: Could not load lap {lap['LapNumber']}: {e}")
-                        continue
+                self._clean_telemetry_data()
                 
-                if telemetry_list:
-                    self.car_data = pd.concat(telemetry_list, ignore_index=True)
-                    print(f"[INFO] Combined telemetry: {len(self.car_data)} total samples")
-                    print(f"[INFO] Total race time covered: {cumulative_time}")
-                    print(f"[INFO] Loaded {self.total_laps} laps for streaming")
-                else:
-                    # fallback
-                    print("[WARN] No valid telemetry found, using fastest lap")
-                    fastest_lap = driver_laps.pick_fastest()
-                    self.car_data = fastest_lap.get_telemetry()
-                    self.total_laps = 1
-                    self.lap_boundaries = [(0, len(self.car_data)-1, fastest_lap['LapNumber'], fastest_lap['LapTime'])]
-            else:
-                fastest_lap = driver_laps.pick_fastest()
-                self.car_data = fastest_lap.get_telemetry()
-            
-            self._clean_telemetry_data()
+                if USE_PROCESSED_CACHE:
+                    self._save_processed_cache(cache_path)
             
             print(f"[LOAD] Loaded {len(self.car_data)} telemetry samples")
             print(f"[INFO] Original sample rate: ~{self._calculate_original_rate():.0f}Hz")
             print(f"[INFO] Interpolate to: {BASE_FREQUENCY_HZ}Hz")
             
-            # DBG: telemetry data
-            print("\n[DIAGNOSTIC] Telemetry data range:")
-            print(f"  Speed: {self.car_data['Speed'].min():.0f} - {self.car_data['Speed'].max():.0f} km/h")
-            print(f"  Throttle: {self.car_data['Throttle'].min():.0f} - {self.car_data['Throttle'].max():.0f}%")
-            print(f"  Brake: {self.car_data['Brake'].min():.1f} - {self.car_data['Brake'].max():.1f}")
-            print(f"  Gear: {self.car_data['nGear'].min()} - {self.car_data['nGear'].max()}")
-            print(f"  RPM: {self.car_data['RPM'].min():.0f} - {self.car_data['RPM'].max():.0f}")
-            
-            # DBG: data variation
-            print("\n[DIAGNOSTIC] Data variation check:")
-            speed_changes = self.car_data['Speed'].diff().abs().sum()
-            throttle_changes = self.car_data['Throttle'].diff().abs().sum()
-            brake_applications = (self.car_data['Brake'] > 0.5).sum()
-            
-            print(f"  Total speed changes: {speed_changes:.0f} km/h")
-            print(f"  Total throttle changes: {throttle_changes:.0f}%")
-            print(f"  Heavy brake applications: {brake_applications}")
-            
-            if speed_changes < 1000:
-                print("  !!  WARNING: Low variation in data - may show static telemetry!")
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_diagnostics()
             
             return True
             
@@ -144,26 +88,215 @@ class F1DataSource:
             traceback.print_exc()
             return False
         
-    def _get_current_lap_info(self, telemetry_idx: int, total_interpolated_samples: int) -> tuple:
-        if not self.lap_boundaries:
-            return 1, 0.0, None
+    def _fetch_session_telemetry(self, session_type: str) -> bool:
+        print(f"\n[LOAD] Fetching {self.year} {self.race} {session_type}...")
+        print("[LOAD] Wait for a while...")
+        
+        self.session = fastf1.get_session(self.year, self.race, session_type)
+        self.session.load(telemetry=True)
+        
+        driver_laps = self.session.laps.pick_drivers(TARGET_CAR_NUMBER)
+        
+        if driver_laps.empty:
+            print(f"[ERROR] No data for car #{TARGET_CAR_NUMBER}")
+            return False
+        
+        print(f"[INFO] Found {len(driver_laps)} laps for car #{TARGET_CAR_NUMBER}")
+        
+        if LOAD_ALL_LAPS and len(driver_laps) > 1:
+            complete_laps = driver_laps[driver_laps['LapTime'].notna()]
+            
+            if MAX_LAPS_TO_LOAD:
+                complete_laps = complete_laps.iloc[:MAX_LAPS_TO_LOAD]
+                print(f"[INFO] Limited to {MAX_LAPS_TO_LOAD} laps per config")
+
+
+            telemetry_list = []
+            cumulative_time = pd.Timedelta(0)
+
+            # Track lap boundaries
+            lap_lens = []
+            lap_nums = []
+            lap_times = []
+            self.total_laps = len(complete_laps)
+
+            for idx, lap in complete_laps.iterrows():
+                try:
+                    lap_telemetry = lap.get_telemetry()
+                    if lap_telemetry is not None and not lap_telemetry.empty:
+                        # store lap boundary info
+                        lap_lens.append(len(lap_telemetry))
+                        lap_nums.append(lap['LapNumber'])
+                        lap_times.append(lap['LapTime'])
+
+                        # time made cumulative across laps when combined
+                        telemetry_list.append((lap_telemetry, cumulative_time))
+                        # print(f"  Lap {lap['LapNumber']}: {len(lap_telemetry)} samples, "f"LapTime: {lap['LapTime']}")
+                        
+                        # update cumulative time for next lap
+                        cumulative_time = cumulative_time + lap_telemetry['Time'].iloc[-1]
+                except Exception as e:
+                    print(f"  Warning: Could not load lap {lap['LapNumber']}: {e}")
+                    continue
+            
+            if telemetry_list:
+                self._set_lap_boundaries(lap_lens, lap_nums, lap_times)
+                self.car_data = self._combine_lap_telemetry(telemetry_list, sum(lap_lens))
+                print(f"[INFO] Combined telemetry: {len(self.car_data)} total samples")
+                print(f"[INFO] Total race time covered: {cumulative_time}")
+                print(f"[INFO] Loaded {self.total_laps} laps for streaming")
+            else:
+                # fallback
+                print("[WARN] No valid telemetry found, using fastest lap")
+                fastest_lap = driver_laps.pick_fastest()
+                self.car_data = fastest_lap.get_telemetry()
+                self.total_laps = 1
+                self._set_lap_boundaries([len(self.car_data)], [fastest_lap['LapNumber']], [fastest_lap['LapTime']])
+        else:
+            fastest_lap = driver_laps.pick_fastest()
+            self.car_data = fastest_lap.get_telemetry()
+        
+        return True
+    
+    def _set_lap_boundaries(self, lap_lens: list, lap_nums: list, lap_times: list):
+        # laps are back to back in the combined telemetry, so boundaries follow from the lengths
+        lens = np.asarray(lap_lens, dtype=np.int64)
+        starts = np.r_[0, lens.cumsum()[:-1]]
+        ends = starts + lens - 1
+        self._boundary_arrays = (starts, ends, np.asarray(lap_nums, dtype=np.float64), list(lap_times))
+    
+    def _processed_cache_path(self, session_type: str) -> str:
+        laps = (MAX_LAPS_TO_LOAD or 'all') if LOAD_ALL_LAPS else 'fastest'
+        filename = f"processed_{self.year}_{self.race}_{session_type}_{TARGET_CAR_NUMBER}_{laps}.npz"
+        return os.path.join(CACHE_DIR, filename)
+    
+    def _load_processed_cache(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            with np.load(path) as cached:
+                self.car_data = pd.DataFrame({'Time': cached['Time'], **{col: cached[col] for col in TELEMETRY_CHANNELS}})
+                if len(cached['lap_starts']):
+                    self._boundary_arrays = (
+                        cached['lap_starts'],
+                        cached['lap_ends'],
+                        cached['lap_numbers'],
+                        [pd.Timedelta(t) for t in cached['lap_times']],
+                    )
+                else:
+                    self._boundary_arrays = None
+                self.total_laps = int(cached['total_laps'])
+        except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            # truncated or stale cache file, treat it as a miss and fetch again
+            print(f"[WARN] Ignoring unreadable processed session cache {path}: {e}")
+            self.car_data = None
+            self._boundary_arrays = None
+            return False
+        return True
+    
+    def _save_processed_cache(self, path: str):
+        # cleaned channels and lap boundaries only, enough to skip FastF1 on the next run
+        starts, ends, lap_nums, lap_times = self._boundary_arrays or ((), (), (), ())
+        tmp_path = path + '.tmp'
+        try:
+            # write next to the target and swap it in, a crash mid-write never leaves a partial cache
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    Time=self.car_data['Time'].to_numpy(dtype='timedelta64[ns]'),
+                    **{col: self.car_data[col].to_numpy() for col in TELEMETRY_CHANNELS},
+                    lap_starts=np.asarray(starts, dtype=np.int64),
+                    lap_ends=np.asarray(ends, dtype=np.int64),
+                    lap_numbers=np.asarray(lap_nums, dtype=np.float64),
+                    lap_times=np.array([pd.Timedelta(t).to_timedelta64() for t in lap_times], dtype='timedelta64[ns]'),
+                    total_laps=self.total_laps,
+                )
+            os.replace(tmp_path, path)
+            print(f"[LOAD] Saved processed session cache: {path}")
+        except OSError as e:
+            print(f"[WARN] Could not write processed session cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _log_diagnostics(self):
+        # one min/max pass per column plus one diff pass, instead of a scan per statistic
+        ranges = self.car_data[['Speed', 'Throttle', 'Brake', 'nGear', 'RPM']].agg(['min', 'max'])
+        changes = self.car_data[['Speed', 'Throttle']].diff().abs().sum()
+        brake_applications = int((self.car_data['Brake'] > 0.5).sum())
+        
+        # DBG: telemetry data
+        logger.debug("\n[DIAGNOSTIC] Telemetry data range:")
+        logger.debug("  Speed: %.0f - %.0f km/h", ranges.at['min', 'Speed'], ranges.at['max', 'Speed'])
+        logger.debug("  Throttle: %.0f - %.0f%%", ranges.at['min', 'Throttle'], ranges.at['max', 'Throttle'])
+        logger.debug("  Brake: %.1f - %.1f", ranges.at['min', 'Brake'], ranges.at['max', 'Brake'])
+        logger.debug("  Gear: %d - %d", ranges.at['min', 'nGear'], ranges.at['max', 'nGear'])
+        logger.debug("  RPM: %.0f - %.0f", ranges.at['min', 'RPM'], ranges.at['max', 'RPM'])
+        
+        # DBG: data variation
+        logger.debug("\n[DIAGNOSTIC] Data variation check:")
+        logger.debug("  Total speed changes: %.0f km/h", changes['Speed'])
+        logger.debug("  Total throttle changes: %.0f%%", changes['Throttle'])
+        logger.debug("  Heavy brake applications: %d", brake_applications)
+        
+        if changes['Speed'] < 1000:
+            logger.debug("  !!  WARNING: Low variation in data - may show static telemetry!")
+    
+    def _combine_lap_telemetry(self, telemetry_list: list, total_samples: int) -> pd.DataFrame:
+        # laps share one schema, so fill a preallocated slab instead of pd.concat
+        values = np.empty((total_samples, len(TELEMETRY_CHANNELS)), dtype=np.float32)
+        times = np.empty(total_samples, dtype='timedelta64[ns]')
+        
+        offset = 0
+        for lap_telemetry, time_offset in telemetry_list:
+            n = len(lap_telemetry)
+            values[offset:offset + n] = lap_telemetry[TELEMETRY_CHANNELS].to_numpy(dtype=np.float32, na_value=np.nan)
+            # only Time is shifted, written straight into the side array
+            np.add(lap_telemetry['Time'].to_numpy(dtype='timedelta64[ns]'), time_offset.to_timedelta64(),
+                   out=times[offset:offset + n])
+            offset += n
+        
+        car_data = pd.DataFrame(values, columns=TELEMETRY_CHANNELS)
+        car_data.insert(0, 'Time', times)
+        return car_data
+    
+    def _build_lap_index(self, total_interpolated_samples: int):
+        if self._boundary_arrays is None:
+            self._lap_start_scaled = self._lap_end_scaled = None
+            return
+        
+        starts, ends, lap_nums, lap_times = self._boundary_arrays
         
         # calculate scaling factor for interpolated data
-        original_total_samples = sum(end - start + 1 for start, end, _, _ in self.lap_boundaries)
+        original_total_samples = int((ends - starts + 1).sum())
         scale_factor = total_interpolated_samples / original_total_samples if original_total_samples > 0 else 1
         
-        # scale boundaries to match interpolated data
-        for start_idx, end_idx, lap_num, lap_time in self.lap_boundaries:
-            scaled_start = int(start_idx * scale_factor)
-            scaled_end = int((end_idx + 1) * scale_factor) - 1
-            
-            if scaled_start <= telemetry_idx <= scaled_end:
-                lap_length = scaled_end - scaled_start + 1
-                lap_progress = ((telemetry_idx - scaled_start) / lap_length) * 100 if lap_length > 0 else 0
-                return lap_num, lap_progress, lap_time
+        # scale boundaries to match interpolated data, end is exclusive
+        # kept as lists, the cursor below does scalar lookups
+        self._lap_start_scaled = (starts * scale_factor).astype(np.int64).tolist()
+        self._lap_end_scaled = ((ends + 1) * scale_factor).astype(np.int64).tolist()
+        self._lap_nums = lap_nums.tolist()
+        self._lap_times = lap_times
+        self._lap_cursor = 0
+    
+    def _get_current_lap_info(self, telemetry_idx: int) -> tuple:
+        if self._lap_end_scaled is None:
+            return 1, 0.0, None
+        
+        # idx only moves forward while streaming, so the cursor advances at most once per lap
+        last_lap = len(self._lap_end_scaled) - 1
+        while self._lap_cursor < last_lap and telemetry_idx >= self._lap_end_scaled[self._lap_cursor]:
+            self._lap_cursor += 1
+        i = self._lap_cursor
         
         # If we're beyond all boundaries, return the last lap
-        return self.lap_boundaries[-1][2], 100.0, self.lap_boundaries[-1][3]
+        if telemetry_idx >= self._lap_end_scaled[i]:
+            return self._lap_nums[-1], 100.0, self._lap_times[-1]
+        
+        lap_start = self._lap_start_scaled[i]
+        lap_length = self._lap_end_scaled[i] - lap_start
+        lap_progress = ((telemetry_idx - lap_start) / lap_length) * 100 if lap_length > 0 else 0
+        return self._lap_nums[i], lap_progress, self._lap_times[i]
 
     def _clean_telemetry_data(self):
         if self.car_data is None:
@@ -182,6 +315,10 @@ class F1DataSource:
         for col in numeric_columns:
             if col in self.car_data.columns:
                 self.car_data[col] = pd.to_numeric(self.car_data[col], errors='coerce').fillna(0)
+        
+        # fix channel dtypes once here, so nothing downstream has to check per sample
+        self.car_data = self.car_data.astype(
+            {col: dtype for col, dtype in CHANNEL_DTYPES.items() if col in self.car_data.columns})
     
 
     def _calculate_original_rate(self) -> float:
@@ -200,7 +337,6 @@ class F1DataSource:
         
         print(f"[INTERP] Upsampling to {target_hz}Hz...")
         
-        df = df.copy()
         df = df.drop_duplicates(subset=['Time'], keep='first')
         df = df.sort_values('Time')
         
@@ -211,41 +347,37 @@ class F1DataSource:
         print(f"[INTERP] Duration to interpolate: {duration:.1f} seconds")
         
         target_samples = int(duration * target_hz)
-        time_index = pd.to_timedelta(np.linspace(0, duration, target_samples), unit='s')
         
-        df_indexed = df.set_index('Time')
-        
-        for col in df_indexed.columns:
-            if col not in ['Date', 'Time', 'Driver']:  # skip non-numeric col
-                df_indexed[col] = pd.to_numeric(df_indexed[col], errors='coerce')
+        t_src = (df['Time'] - start_time).dt.total_seconds().to_numpy()
+        t_dst = np.linspace(0, duration, target_samples)
         
         continuous_cols = ['Speed', 'Throttle', 'Brake', 'RPM', 'DRS']
         discrete_cols = ['nGear']
         
-        df_uniform = pd.DataFrame(index=time_index + start_time)
+        columns = {'Time': pd.to_timedelta(t_dst, unit='s') + start_time}
         
         # interpolate cont col
         for col in continuous_cols:
-            if col in df_indexed.columns:
-                series = pd.to_numeric(df_indexed[col], errors='coerce').fillna(0)
-                df_uniform[col] = series.reindex(df_uniform.index, method='nearest').interpolate(method='linear').fillna(0)
+            if col in df.columns:
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+                columns[col] = np.interp(t_dst, t_src, values)
         
-        # fwd fill dis col
+        # zero-order hold dis col (last known value)
+        hold_idx = np.searchsorted(t_src, t_dst, side='right') - 1
         for col in discrete_cols:
-            if col in df_indexed.columns:
-                df_uniform[col] = df_indexed[col].reindex(df_uniform.index, method='nearest').ffill().fillna(0)
+            if col in df.columns:
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+                columns[col] = values[hold_idx]
         
         # remaining numeric col
-        for col in df_indexed.columns:
-            if col not in df_uniform.columns and col not in ['Date', 'Time', 'Driver']:
-                try:
-                    series = pd.to_numeric(df_indexed[col], errors='coerce')
-                    df_uniform[col] = series.reindex(df_uniform.index, method='nearest').interpolate(method='linear').fillna(0)
-                except:  # noqa: E722
-                    pass  # skip if can't be interpolated
+        for col in df.columns:
+            if col not in columns and col not in ['Date', 'Time', 'Driver']:
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    continue  # skip if can't be interpolated
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+                columns[col] = np.interp(t_dst, t_src, values)
         
-        df_uniform = df_uniform.reset_index()
-        df_uniform.rename(columns={'index': 'Time'}, inplace=True)
+        df_uniform = pd.DataFrame(columns)
         
         print(f"[INTERP] Generated {len(df_uniform)} samples ({target_hz}Hz)")
         print(f"[INTERP] This represents {len(df_uniform)/target_hz:.1f} seconds of racing")
@@ -253,109 +385,161 @@ class F1DataSource:
         return df_uniform
     
 
-    def _simulate_sensor_data(self, base_telemetry: pd.Series) -> Dict:
-        rpm = float(base_telemetry.get('RPM', 8000))
-        if pd.isna(rpm):
-            rpm = 8000.0
-            
-        throttle_raw = base_telemetry.get('Throttle', 0)
-        if pd.isna(throttle_raw):
-            throttle_raw = 0
-        throttle = float(throttle_raw) / 100.0
-        
-        speed = float(base_telemetry.get('Speed', 0))
-        if pd.isna(speed):
-            speed = 0.0
-            
-        brake_raw = base_telemetry.get('Brake', 0)
-
-        if isinstance(brake_raw, bool):
-            brake = 1.0 if brake_raw else 0.0
-        elif pd.isna(brake_raw):
-            brake = 0.0
-        else:
-            brake = float(brake_raw)
-            
-        drs = float(base_telemetry.get('DRS', 0))
-        if pd.isna(drs):
-            drs = 0.0
+    def _simulate_sensor_data(self, speed: np.ndarray, throttle: np.ndarray, brake: np.ndarray,
+                              rpm: np.ndarray, drs: np.ndarray) -> Dict[str, np.ndarray]:
+        # every channel is written in place through one float32 scratch buffer,
+        # so the kernel allocates its outputs and nothing else
+        scratch = np.empty(len(speed), dtype=np.float32)
+        
+        # throttle comes in as percent
+        throttle = throttle / 100.0
         
         # simulating oil pr based on RPM
-        oil_pressure = 4.0 + (rpm / 15000) * 2.0
+        oil_pressure = rpm * (2.0 / 15000)
+        oil_pressure += 4.0
         
         # simulating temp based on throttle and speed
-        oil_temp = 90 + throttle * 20 + np.random.normal(0, 2)
-        water_temp = 85 + throttle * 25 + np.random.normal(0, 2)
-        exhaust_temp = 600 + throttle * 300
+        np.multiply(throttle, 20, out=scratch)
+        scratch += 90
+        scratch += self._oil_noise
+        oil_temp = scratch.astype(np.int32)
+        
+        np.multiply(throttle, 25, out=scratch)
+        scratch += 85
+        scratch += self._water_noise
+        water_temp = scratch.astype(np.int32)
+        
+        np.multiply(throttle, 300, out=scratch)
+        scratch += 600
+        exhaust_temp = scratch.astype(np.int32)
         
         # simulating ERS deployment
-        ers_store = 4000000 * (0.5 + 0.5 * np.sin(self.packet_counter / 100))  # Joules
-        mguk_power = throttle * 120000 if drs > 0 else 0  # Watts
+        ers_store = np.sin(np.arange(self.packet_counter, self.packet_counter + len(speed)) * 0.01)
+        ers_store *= 0.5 * 4000000
+        ers_store += 0.5 * 4000000  # Joules
+        
+        mguk_power = throttle * 120000  # Watts
+        mguk_power *= drs > 0
         
         # simulating fuel flow (max 100kg/h)
         fuel_flow = throttle * 100  # kg/h
         
         # tyre temps inc with speed and brake
-        speed_factor = speed / 350 if speed > 0 else 0
-        brake_factor = brake
+        speed_factor = speed / 350
+        np.maximum(speed_factor, 0, out=speed_factor)
         base_tyre_temp = 80
         
-        tyre_temps = [
-            int(base_tyre_temp + speed_factor * 20 + brake_factor * 30),  # FL
-            int(base_tyre_temp + speed_factor * 20 + brake_factor * 30),  # FR
-            int(base_tyre_temp + speed_factor * 15),  # RL
-            int(base_tyre_temp + speed_factor * 15),  # RR
-        ]
+        np.multiply(brake, 30, out=scratch)
+        scratch += base_tyre_temp
+        scratch += speed_factor * 20
+        tyre_front = scratch.astype(np.int32)  # FL, FR
+        
+        np.multiply(speed_factor, 15, out=scratch)
+        scratch += base_tyre_temp
+        tyre_rear = scratch.astype(np.int32)  # RL, RR
         
         return {
             'oil_pressure': oil_pressure,
-            'oil_temp': int(oil_temp),
-            'water_temp': int(water_temp),
-            'exhaust_temp': int(exhaust_temp),
+            'oil_temp': oil_temp,
+            'water_temp': water_temp,
+            'exhaust_temp': exhaust_temp,
             'ers_store': ers_store,
             'mguk_power': mguk_power,
             'fuel_flow': fuel_flow,
-            'tyre_temps': tyre_temps,
-            'tyre_core_temps': [t + 5 for t in tyre_temps]
+            'tyre_front': tyre_front,
+            'tyre_rear': tyre_rear,
         }
 
-    def generate_packets(self, realtime: bool = True) -> Generator[F1TelemetryPacket, None, None]:
-        if self.car_data is None:
-            print("[ERROR] No data loaded")
-            return
-        
+    def _prepare_stream(self) -> Dict[str, np.ndarray]:
+        # everything the packet loops need, computed for the whole stream up front
         telemetry = self._interpolate_to_realistic_rate(self.car_data)
-        total_interpolated_samples = len(telemetry)
         
-        print(f"\n[INFO] Generating packets for {len(telemetry)} telemetry points")
+        # columnar copy of the hot channels, the interpolated frame is dropped after this
+        self._cols = {name: telemetry[name].to_numpy(np.float32) for name in TELEMETRY_CHANNELS}
+        del telemetry
+        
+        cols = self._cols
+        total_samples = len(cols['Speed'])
+        self._build_lap_index(total_samples)
+        
+        # sensor noise drawn in one batch, sd 2C
+        self._oil_noise = self._rng.standard_normal(total_samples, dtype=np.float32) * 2.0
+        self._water_noise = self._rng.standard_normal(total_samples, dtype=np.float32) * 2.0
+        
+        print(f"\n[INFO] Generating packets for {total_samples} telemetry points")
         print(f"[INFO] Streaming {self.total_laps} lap(s)")
-        print(f"[INFO] Data preview - First: Speed={telemetry['Speed'].iloc[0]:.0f}, "
-            f"Last: Speed={telemetry['Speed'].iloc[-1]:.0f}")
+        print(f"[INFO] Data preview - First: Speed={cols['Speed'][0]:.0f}, "
+            f"Last: Speed={cols['Speed'][-1]:.0f}")
         
-        total_duration = len(telemetry) / BASE_FREQUENCY_HZ
+        total_duration = total_samples / BASE_FREQUENCY_HZ
         print(f"[INFO] Total stream duration: {total_duration:.1f} seconds\n")
         
-        start_time = time.time()
-        base_timestamp = int(start_time * 1000)
+        # sensors simulated for the whole stream in one pass
+        sensors = self._simulate_sensor_data(cols['Speed'], cols['Throttle'], cols['Brake'],
+                                             cols['RPM'], cols['DRS'])
+        
+        # water temp alarm overrides the default priority
+        priorities = np.where(sensors['water_temp'] > 120, PacketPriority.CRITICAL, PacketPriority.HIGH)
+        
+        # per-packet timestamps and fuel load follow the packet counter
+        base_timestamp = int(time.time() * 1000)
+        counters = np.arange(self.packet_counter, self.packet_counter + total_samples)
+        timestamps = base_timestamp + (counters * PACKET_INTERVAL_MS).astype(np.int64)
+        fuel_remaining = 110.0 - counters * 0.0001  # simulate fuel usage from 110kg
+        
+        return dict(sensors, priority=priorities, packet_id=counters,
+                    timestamp=timestamps, fuel_remaining=fuel_remaining)
+    
+    def print_lap_start(self, lap_num: int, lap_time):
+        print(f"\n{'='*60}")
+        print(f"[LAP START] Now streaming Lap {int(lap_num)} of {self.total_laps}")
+        if lap_time:
+            print(f"[LAP INFO] Lap time: {lap_time}")
+        print(f"{'='*60}\n")
+    
+    def print_lap_complete(self, lap_num: int, lap_packets: int):
+        print(f"\n[LAP COMPLETE] Lap {int(lap_num)} finished - {lap_packets} packets sent")
+    
+    def print_stream_complete(self, lap_num: int, lap_packets: int, total_duration: float):
+        self.print_lap_complete(lap_num, lap_packets)
+        print(f"\n{'='*60}")
+        print(f"[COMPLETE] Finished streaming all {self.total_laps} laps")
+        print(f"[INFO] Total packets sent: {self.packet_counter}")
+        print(f"[INFO] Total time streamed: {total_duration:.1f} seconds")
+        print(f"{'='*60}")
+    
+    def generate_packets(self, realtime: bool = True) -> Generator[F1TelemetryPacket, None, None]:
+        if self.car_data is None:
+            print("[ERROR] No data loaded")
+            return
+        
+        stream = self._prepare_stream()
+        cols = self._cols
+        total_samples = len(cols['Speed'])
+        total_duration = total_samples / BASE_FREQUENCY_HZ
         
+        start_time = time.time()
         last_lap_num = 0
         lap_start_packet = 0
-        
-        for idx in range(len(telemetry)):
-            row = telemetry.iloc[idx]
-            
-            current_lap_num, lap_progress, lap_time = self._get_current_lap_info(idx, total_interpolated_samples)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        columns = zip(
+            cols['Speed'], cols['Throttle'], cols['Brake'], cols['RPM'], cols['nGear'], cols['DRS'],
+            stream['priority'], stream['oil_pressure'], stream['oil_temp'], stream['water_temp'],
+            stream['exhaust_temp'], stream['ers_store'], stream['mguk_power'], stream['fuel_flow'],
+            stream['tyre_front'], stream['tyre_rear'], stream['timestamp'], stream['fuel_remaining'],
+        )
+        
+        for idx, (spd, thr, brk, eng_rpm, gr, drs_val, prio,
+                  oil_p, oil_t, water_t, exhaust_t, ers, mguk, fuel_flow, tyre_f, tyre_r,
+                  timestamp_ms, fuel_left) in enumerate(columns):
+            current_lap_num, lap_progress, lap_time = self._get_current_lap_info(idx)
             
             if current_lap_num != last_lap_num:
                 if last_lap_num > 0:
-                    lap_packets = self.packet_counter - lap_start_packet
-                    print(f"\n[LAP COMPLETE] Lap {last_lap_num} finished - {lap_packets} packets sent")
+                    self.print_lap_complete(last_lap_num, self.packet_counter - lap_start_packet)
                 
-                print(f"\n{'='*60}")
-                print(f"[LAP START] Now streaming Lap {int(current_lap_num)} of {self.total_laps}")
-                if lap_time:
-                    print(f"[LAP INFO] Lap time: {lap_time}")
-                print(f"{'='*60}\n")
+                self.print_lap_start(current_lap_num, lap_time)
                 
                 last_lap_num = current_lap_num
                 lap_start_packet = self.packet_counter
@@ -363,96 +547,136 @@ class F1DataSource:
             # update current lap for external access
             self.current_lap = int(current_lap_num)
             
-            # simulate additional sensors
-            sensor_data = self._simulate_sensor_data(row)
-            
-            # determine packet priority based on conditions
-            priority = PacketPriority.HIGH
-            if sensor_data['water_temp'] > 120:
-                priority = PacketPriority.CRITICAL
-            elif row.get('DRS', 0) > 0:
-                priority = PacketPriority.HIGH
-            
-            def safe_int(value, default=0):
-                if pd.isna(value):
-                    return default
-                try:
-                    return int(float(value))
-                except:  # noqa: E722
-                    return default
-            
-            def safe_float(value, default=0.0):
-                if pd.isna(value):
-                    return default
-                try:
-                    return float(value)
-                except:  # noqa: E722
-                    return default
+            speed_kmh = int(spd)
+            throttle_percent = float(thr) / 100.0
+            brake_percent = float(brk)
+            gear_num = int(gr)
+            engine_rpm = int(eng_rpm)
+            drs_active = bool(drs_val)
+            tyre_f = int(tyre_f)
+            tyre_r = int(tyre_r)
             
             packet = F1TelemetryPacket(
-                timestamp_ms=base_timestamp + int(self.packet_counter * PACKET_INTERVAL_MS),
+                timestamp_ms=int(timestamp_ms),
                 car_number=TARGET_CAR_NUMBER,
                 packet_id=self.packet_counter,
-                priority=priority,
+                priority=PacketPriority(prio),
                 
                 # telemetry
-                speed_kmh=safe_int(row.get('Speed', 0)),
-                throttle_percent=safe_float(row.get('Throttle', 0)) / 100.0,
-                brake_percent=safe_float(row.get('Brake', 0)),
+                speed_kmh=speed_kmh,
+                throttle_percent=throttle_percent,
+                brake_percent=brake_percent,
                 steering_angle=0.0,
-                gear=safe_int(row.get('nGear', 0)),
-                engine_rpm=safe_int(row.get('RPM', 0)),
-                drs_active=bool(safe_float(row.get('DRS', 0))),
+                gear=gear_num,
+                engine_rpm=engine_rpm,
+                drs_active=drs_active,
                 
                 # engine params
-                oil_pressure_bar=sensor_data['oil_pressure'],
-                oil_temp_c=sensor_data['oil_temp'],
-                water_temp_c=sensor_data['water_temp'],
-                exhaust_temp_c=sensor_data['exhaust_temp'],
+                oil_pressure_bar=float(oil_p),
+                oil_temp_c=int(oil_t),
+                water_temp_c=int(water_t),
+                exhaust_temp_c=int(exhaust_t),
                 
                 # tyre data
-                tyre_pressure_psi=[23.0, 23.0, 21.0, 21.0],
-                tyre_temp_surface_c=sensor_data['tyre_temps'],
-                tyre_temp_core_c=sensor_data['tyre_core_temps'],
+                tyre_pressure_psi=TYRE_PRESSURE_PSI,
+                tyre_temp_surface_c=(tyre_f, tyre_f, tyre_r, tyre_r),
+                tyre_temp_core_c=(tyre_f + 5, tyre_f + 5, tyre_r + 5, tyre_r + 5),
                 
                 # energy systems
-                ers_store_j=sensor_data['ers_store'],
-                mguk_power_w=sensor_data['mguk_power'],
+                ers_store_j=float(ers),
+                mguk_power_w=float(mguk),
                 
                 # fuel
-                fuel_flow_rate_kg_h=sensor_data['fuel_flow'],
-                fuel_remaining_kg=110.0 - (self.packet_counter * 0.0001)  # simulate fuel usage from 110kg
+                fuel_flow_rate_kg_h=float(fuel_flow),
+                fuel_remaining_kg=float(fuel_left)
             )
-            
+        
             self.packet_counter += 1
             
             # DBG
-            if self.packet_counter % 1000 == 0:
+            if debug_enabled and self.packet_counter % 1000 == 0:
                 elapsed = time.time() - start_time
                 pps = self.packet_counter / elapsed if elapsed > 0 else 0
-                overall_progress = (idx / len(telemetry)) * 100
+                overall_progress = (idx / total_samples) * 100
                 
-                print(f"[DEBUG] Packet {self.packet_counter}: "
-                    f"Speed={packet.speed_kmh} "
-                    f"Throttle={packet.throttle_percent:.1%} "
-                    f"Brake={packet.brake_percent:.1%} "
-                    f"Gear={packet.gear}")
-                print(f"[STREAM] Lap {int(current_lap_num)}/{self.total_laps} "
-                    f"({lap_progress:.1f}% of lap) | "
-                    f"Overall: {overall_progress:.1f}% | "
-                    f"{pps:.0f} pps")
+                logger.debug("[DEBUG] Packet %d: Speed=%d Throttle=%.1f%% Brake=%.1f%% Gear=%d",
+                             self.packet_counter, speed_kmh, throttle_percent * 100, brake_percent * 100, gear_num)
+                logger.debug("[STREAM] Lap %d/%d (%.1f%% of lap) | Overall: %.1f%% | %.0f pps",
+                             current_lap_num, self.total_laps, lap_progress, overall_progress, pps)
             
             # are we at the end
-            if idx == len(telemetry) - 1:
-                lap_packets = self.packet_counter - lap_start_packet
-                print(f"\n[LAP COMPLETE] Lap {int(current_lap_num)} finished - {lap_packets} packets sent")
-                print(f"\n{'='*60}")
-                print(f"[COMPLETE] Finished streaming all {self.total_laps} laps")
-                print(f"[INFO] Total packets sent: {self.packet_counter}")
-                print(f"[INFO] Total time streamed: {total_duration:.1f} seconds")
-                print(f"{'='*60}")
+            if idx == total_samples - 1:
+                self.print_stream_complete(current_lap_num, self.packet_counter - lap_start_packet,
+                                           total_duration)
             
             yield packet
+    
+    def generate_packet_batches(self, realtime: bool = True,
+                                batch: int = PACKET_BATCH_SIZE) -> Generator[List[bytes], None, None]:
+        # same wire bytes as to_udp_bytes() on each generate_packets packet, packed for the whole stream in
+        # one vectorized pass and handed out `batch` packets per step
+        # lap tracking and metrics run once per batch rather than per packet
+        # no lap output here, this runs ahead of the send loop; the consumer prints lap
+        # changes from current_lap / current_lap_time once the packets are actually sent
+        if self.car_data is None:
+            print("[ERROR] No data loaded")
+            return
+        
+        stream = self._prepare_stream()
+        cols = self._cols
+        total_samples = len(cols['Speed'])
+        
+        tyre_f = stream['tyre_front']
+        tyre_r = stream['tyre_rear']
+        records = pack_columns(
+            stream['timestamp'], stream['packet_id'], stream['priority'],
+            cols['Speed'], cols['Throttle'].astype(np.float64) / 100.0, cols['Brake'], 0.0,
+            cols['nGear'], cols['RPM'], cols['DRS'] != 0,
+            stream['oil_pressure'], stream['oil_temp'], stream['water_temp'],
+            TYRE_PRESSURE_PSI, (tyre_f, tyre_f, tyre_r, tyre_r),
+            stream['ers_store'], stream['mguk_power'], stream['fuel_flow'],
+        )
+        del stream, tyre_f, tyre_r
+        
+        start_time = time.time()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        size = PACKET_SIZE_BYTES
+        
+        start = 0
+        while start < total_samples:
+            current_lap_num, lap_progress, lap_time = self._get_current_lap_info(start)
+            
+            # a batch never crosses a lap boundary, so each packet is counted in its own lap
+            # at the cost of one short batch per lap
+            stop = min(start + batch, total_samples)
+            if self._lap_end_scaled:
+                lap_end = self._lap_end_scaled[self._lap_cursor]
+                if start < lap_end < stop:
+                    stop = lap_end
+            self.current_lap = int(current_lap_num)
+            self.current_lap_time = lap_time
+            
+            raw = records[start:stop].tobytes()
+            packets = [raw[i:i + size] for i in range(0, len(raw), size)]
+            
+            prev_counter = self.packet_counter
+            self.packet_counter += stop - start
+            
+            # DBG, once per 1000 packets crossed
+            if debug_enabled and self.packet_counter // 1000 != prev_counter // 1000:
+                last = stop - 1
+                elapsed = time.time() - start_time
+                pps = self.packet_counter / elapsed if elapsed > 0 else 0
+                overall_progress = (last / total_samples) * 100
+                
+                logger.debug("[DEBUG] Packet %d: Speed=%d Throttle=%.1f%% Brake=%.1f%% Gear=%d",
+                             self.packet_counter, int(cols['Speed'][last]), cols['Throttle'][last],
+                             cols['Brake'][last] * 100, int(cols['nGear'][last]))
+                logger.debug("[STREAM] Lap %d/%d (%.1f%% of lap) | Overall: %.1f%% | %.0f pps",
+                             current_lap_num, self.total_laps, lap_progress, overall_progress, pps)
+            
+            yield packets
+            start = stop
 
     def _print_lap_metrics(self, lap_num: int, lap_progress: float, pps: float):
         pass  # handled by UDPTelemetryStreamer
\ No newline at end of file
@@ -0,0 +1,72 @@
+import numpy as np
+
+class LatencyHistogram:
+    # log-linear histogram in the style of HdrHistogram, integer microseconds
+    # values below sub_bucket_count are exact, above that each power of two is
+    # split into sub_bucket_count / 2 linear buckets (~1.5% relative error at 128)
+    # recording is O(1) into a plain list, quantiles run vectorized over the counts
+    def __init__(self, highest_value: int = 10_000_000, sub_bucket_count: int = 128):
+        self.sub_bucket_bits = sub_bucket_count.bit_length() - 1
+        self.sub_bucket_half = sub_bucket_count >> 1
+        self.highest_value = highest_value
+        self.counts = [0] * (self._index_of(highest_value) + 1)
+        self._zeros = [0] * len(self.counts)  # reset copies from this, counts is never reallocated
+
+        # value range of every bucket, for the vectorized queries
+        self._bucket_high = np.array([self._value_range(i)[1] for i in range(len(self.counts))], dtype=np.int64)
+        self.total_count = 0
+        self.total_sum = 0  # exact running sum, the mean needs no bucket walk
+        self.saturated_count = 0  # values above highest_value, recorded as highest_value
+        self.min_value = 0
+        self.max_value = 0
+
+    def _index_of(self, value: int) -> int:
+        bucket = max(value.bit_length() - self.sub_bucket_bits, 0)
+        return bucket * self.sub_bucket_half + (value >> bucket)
+
+    def _value_range(self, index: int) -> tuple:
+        # lowest and highest value that land in counts[index]
+        bucket = max((index // self.sub_bucket_half) - 1, 0)
+        low = (index - bucket * self.sub_bucket_half) << bucket
+        return low, low + (1 << bucket) - 1
+
+    def record_value(self, value: int):
+        # out of range values are clamped to [0, highest_value], saturations are counted
+        value = int(value)
+        if value > self.highest_value:
+            self.saturated_count += 1
+            value = self.highest_value
+        elif value < 0:
+            value = 0
+        self.counts[self._index_of(value)] += 1
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+        self.total_count += 1
+        self.total_sum += value
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        if self.total_count == 0:
+            return 0
+
+        # count needed to reach the percentile, at least one sample
+        target = max(int(percentile / 100 * self.total_count + 0.5), 1)
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, target))
+        if index >= len(cumulative):
+            return self.max_value
+        return min(int(self._bucket_high[index]), self.max_value)
+
+    def get_mean_value(self) -> float:
+        if self.total_count == 0:
+            return 0.0
+        return self.total_sum / self.total_count
+
+    def reset(self):
+        self.counts[:] = self._zeros
+        self.total_count = 0
+        self.total_sum = 0
+        self.saturated_count = 0
+        self.min_value = 0
+        self.max_value = 0
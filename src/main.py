@@ -1,5 +1,6 @@
 import sys
 import os
+import logging
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -8,6 +9,10 @@ from udp_streamer import UDPTelemetryStreamer
 from config import *
 
 def main():
+    # per-packet and diagnostic output from the data source is logged at DEBUG
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger('data_source').setLevel(logging.DEBUG if DEBUG_LOGGING else logging.INFO)
+    
     print("=" * 70)
     print("TELEMETRY PIPELINE - SIMULATION")
     print("=" * 70)
@@ -1,7 +1,101 @@
 from dataclasses import dataclass
-from typing import List
-import msgpack
+from typing import Tuple
+import struct
 from enum import IntEnum
+import numpy as np
+
+# fixed little-endian wire layout, field order must match pipeline/src/telemetry.rs
+# t, id, p, spd, thr, brk, str, g, rpm, drs, oilp, oilt, h2ot, tp[4], tt[4], ers, mguk, fuel
+# channels with a known range are quantized to fixed point, value = raw / scale
+_PACKER = struct.Struct('<QIBHBBbbH?BBB4H4BHHH')
+PACKET_SIZE_BYTES = _PACKER.size
+
+THROTTLE_SCALE = 255      # 0-1 -> uint8
+BRAKE_SCALE = 255         # 0-1 -> uint8
+STEERING_SCALE = 127      # -1-1 -> int8
+OIL_PRESSURE_SCALE = 10   # 0.1 bar
+TYRE_PRESSURE_SCALE = 100 # 0.01 psi
+ERS_STORE_SCALE = 0.001   # kJ
+MGUK_POWER_SCALE = 0.1    # 10 W
+FUEL_FLOW_SCALE = 100     # 0.01 kg/h
+
+def _sat(value: int, hi: int, lo: int = 0) -> int:
+    # saturate to the wire field range, out of range channels must not wrap or raise
+    return lo if value < lo else hi if value > hi else value
+
+_U8 = 255
+_U16 = 65535
+_I8 = 127
+
+def pack_fields(timestamp_ms, packet_id, priority, speed_kmh, throttle_percent, brake_percent,
+                steering_angle, gear, engine_rpm, drs_active, oil_pressure_bar, oil_temp_c, water_temp_c,
+                tyre_pressure_psi, tyre_temp_surface_c, ers_store_j, mguk_power_w, fuel_flow_rate_kg_h) -> bytes:
+    # only essential data for this packet type, packed in a fixed layout
+    # every narrowed or scaled channel saturates at its field range, same as pack_columns
+    fl, fr, rl, rr = tyre_pressure_psi
+    return _PACKER.pack(
+        timestamp_ms, packet_id, priority, _sat(int(speed_kmh), _U16),
+        _sat(int(throttle_percent * THROTTLE_SCALE + 0.5), _U8),
+        _sat(int(brake_percent * BRAKE_SCALE + 0.5), _U8),
+        _sat(round(steering_angle * STEERING_SCALE), _I8, -_I8 - 1),
+        _sat(int(gear), _I8, -_I8 - 1), _sat(int(engine_rpm), _U16), drs_active,
+        _sat(int(oil_pressure_bar * OIL_PRESSURE_SCALE + 0.5), _U8),
+        _sat(int(oil_temp_c), _U8), _sat(int(water_temp_c), _U8),
+        _sat(int(fl * TYRE_PRESSURE_SCALE + 0.5), _U16), _sat(int(fr * TYRE_PRESSURE_SCALE + 0.5), _U16),
+        _sat(int(rl * TYRE_PRESSURE_SCALE + 0.5), _U16), _sat(int(rr * TYRE_PRESSURE_SCALE + 0.5), _U16),
+        *(_sat(int(t), _U8) for t in tyre_temp_surface_c),
+        _sat(int(ers_store_j * ERS_STORE_SCALE + 0.5), _U16),
+        _sat(int(mguk_power_w * MGUK_POWER_SCALE + 0.5), _U16),
+        _sat(int(fuel_flow_rate_kg_h * FUEL_FLOW_SCALE + 0.5), _U16),
+    )
+
+# same layout as _PACKER as a record dtype, for packing whole columns at once
+PACKET_DTYPE = np.dtype([
+    ('t', '<u8'), ('id', '<u4'), ('p', 'u1'), ('spd', '<u2'), ('thr', 'u1'), ('brk', 'u1'),
+    ('str', 'i1'), ('g', 'i1'), ('rpm', '<u2'), ('drs', '?'), ('oilp', 'u1'), ('oilt', 'u1'),
+    ('h2ot', 'u1'), ('tp', '<u2', (4,)), ('tt', 'u1', (4,)), ('ers', '<u2'), ('mguk', '<u2'),
+    ('fuel', '<u2'),
+])
+assert PACKET_DTYPE.itemsize == PACKET_SIZE_BYTES
+
+def pack_columns(timestamp_ms, packet_id, priority, speed_kmh, throttle_percent, brake_percent,
+                 steering_angle, gear, engine_rpm, drs_active, oil_pressure_bar, oil_temp_c, water_temp_c,
+                 tyre_pressure_psi, tyre_temp_surface_c, ers_store_j, mguk_power_w,
+                 fuel_flow_rate_kg_h) -> np.ndarray:
+    # vectorized pack_fields, one record per packet, records[i].tobytes() == pack_fields(...)
+    # values are clipped to the field range and then truncate on assignment like int(),
+    # scaled fields round half up first
+    records = np.empty(len(timestamp_ms), dtype=PACKET_DTYPE)
+    
+    def put(field, values, scale=None, column=None):
+        target = records[field] if column is None else records[field][:, column]
+        values = np.asarray(values, dtype=np.float64)
+        if scale is not None:
+            values = values * scale + 0.5
+        limits = np.iinfo(target.dtype)
+        target[...] = np.clip(values, limits.min, limits.max)
+    
+    records['t'] = timestamp_ms
+    records['id'] = packet_id
+    records['p'] = priority
+    put('spd', speed_kmh)
+    put('thr', throttle_percent, THROTTLE_SCALE)
+    put('brk', brake_percent, BRAKE_SCALE)
+    put('str', np.rint(np.asarray(steering_angle, dtype=np.float64) * STEERING_SCALE))
+    put('g', gear)
+    put('rpm', engine_rpm)
+    records['drs'] = drs_active
+    put('oilp', oil_pressure_bar, OIL_PRESSURE_SCALE)
+    put('oilt', oil_temp_c)
+    put('h2ot', water_temp_c)
+    for i, psi in enumerate(tyre_pressure_psi):
+        put('tp', psi, TYRE_PRESSURE_SCALE, column=i)
+    for i, temp in enumerate(tyre_temp_surface_c):
+        put('tt', temp, column=i)
+    put('ers', ers_store_j, ERS_STORE_SCALE)
+    put('mguk', mguk_power_w, MGUK_POWER_SCALE)
+    put('fuel', fuel_flow_rate_kg_h, FUEL_FLOW_SCALE)
+    return records
 
 class PacketPriority(IntEnum):
     CRITICAL = 0  # brake failure, etc
@@ -9,7 +103,7 @@ class PacketPriority(IntEnum):
     MEDIUM = 2    # tyres, fuel
     LOW = 3
 
-@dataclass
+@dataclass(slots=True)
 class F1TelemetryPacket:
     # packet metadata
     timestamp_ms: int
@@ -32,10 +126,10 @@ class F1TelemetryPacket:
     water_temp_c: int = 0
     exhaust_temp_c: int = 0
     
-    # tyre data
-    tyre_pressure_psi: List[float] = None  # [FL, FR, RL, RR]
-    tyre_temp_surface_c: List[int] = None
-    tyre_temp_core_c: List[int] = None
+    # tyre data, (FL, FR, RL, RR)
+    tyre_pressure_psi: Tuple[float, float, float, float] = (23.0, 23.0, 21.0, 21.0)
+    tyre_temp_surface_c: Tuple[int, int, int, int] = (90, 90, 85, 85)
+    tyre_temp_core_c: Tuple[int, int, int, int] = (95, 95, 90, 90)
     
     # energy systems (ERS)
     ers_store_j: float = 0.0  # Joules
@@ -47,65 +141,57 @@ class F1TelemetryPacket:
     fuel_flow_rate_kg_h: float = 0.0
     fuel_remaining_kg: float = 0.0
     
-    def __post_init__(self):
-        if self.tyre_pressure_psi is None:
-            self.tyre_pressure_psi = [23.0, 23.0, 21.0, 21.0]
-        if self.tyre_temp_surface_c is None:
-            self.tyre_temp_surface_c = [90, 90, 85, 85]
-        if self.tyre_temp_core_c is None:
-            self.tyre_temp_core_c = [95, 95, 90, 90]
-    
     def to_udp_bytes(self) -> bytes:
-        # different packet types carry different data, only essential data for this packet type
-        data = {
-            't': self.timestamp_ms,
-            'id': self.packet_id,
-            'p': self.priority,
-            'spd': self.speed_kmh,
-            'thr': round(self.throttle_percent, 2),
-            'brk': round(self.brake_percent, 2),
-            'str': round(self.steering_angle, 3),
-            'g': self.gear,
-            'rpm': self.engine_rpm,
-            'drs': self.drs_active,
-            'oilp': round(self.oil_pressure_bar, 1),
-            'oilt': self.oil_temp_c,
-            'h2ot': self.water_temp_c,
-            'tp': [round(p, 1) for p in self.tyre_pressure_psi],
-            'tt': self.tyre_temp_surface_c,
-            'ers': round(self.ers_store_j, 0),
-            'mguk': round(self.mguk_power_w, 0),
-            'fuel': round(self.fuel_flow_rate_kg_h, 2)
-        }
-        return msgpack.packb(data)
+        return pack_fields(
+            self.timestamp_ms,
+            self.packet_id,
+            self.priority,
+            self.speed_kmh,
+            self.throttle_percent,
+            self.brake_percent,
+            self.steering_angle,
+            self.gear,
+            self.engine_rpm,
+            self.drs_active,
+            self.oil_pressure_bar,
+            self.oil_temp_c,
+            self.water_temp_c,
+            self.tyre_pressure_psi,
+            self.tyre_temp_surface_c,
+            self.ers_store_j,
+            self.mguk_power_w,
+            self.fuel_flow_rate_kg_h,
+        )
     
     @classmethod
     def from_udp_bytes(cls, data: bytes) -> 'F1TelemetryPacket': #udp decoding
-        unpacked = msgpack.unpackb(data, raw=False)
+        (t, packet_id, priority, spd, thr, brk, steer, gear, rpm, drs, oilp, oilt, h2ot,
+         tp_fl, tp_fr, tp_rl, tp_rr, tt_fl, tt_fr, tt_rl, tt_rr, ers, mguk, fuel) = _PACKER.unpack(data)
         return cls(
-            timestamp_ms=unpacked['t'],
+            timestamp_ms=t,
             car_number=1,
-            packet_id=unpacked['id'],
-            priority=unpacked.get('p', PacketPriority.HIGH),
-            speed_kmh=unpacked['spd'],
-            throttle_percent=unpacked['thr'],
-            brake_percent=unpacked['brk'],
-            steering_angle=unpacked['str'],
-            gear=unpacked['g'],
-            engine_rpm=unpacked['rpm'],
-            drs_active=unpacked['drs'],
-            oil_pressure_bar=unpacked['oilp'],
-            oil_temp_c=unpacked['oilt'],
-            water_temp_c=unpacked['h2ot'],
-            tyre_pressure_psi=unpacked['tp'],
-            tyre_temp_surface_c=unpacked['tt'],
-            ers_store_j=unpacked['ers'],
-            mguk_power_w=unpacked['mguk'],
-            fuel_flow_rate_kg_h=unpacked['fuel']
+            packet_id=packet_id,
+            priority=priority,
+            speed_kmh=spd,
+            throttle_percent=thr / THROTTLE_SCALE,
+            brake_percent=brk / BRAKE_SCALE,
+            steering_angle=steer / STEERING_SCALE,
+            gear=gear,
+            engine_rpm=rpm,
+            drs_active=drs,
+            oil_pressure_bar=oilp / OIL_PRESSURE_SCALE,
+            oil_temp_c=oilt,
+            water_temp_c=h2ot,
+            tyre_pressure_psi=(tp_fl / TYRE_PRESSURE_SCALE, tp_fr / TYRE_PRESSURE_SCALE,
+                               tp_rl / TYRE_PRESSURE_SCALE, tp_rr / TYRE_PRESSURE_SCALE),
+            tyre_temp_surface_c=(tt_fl, tt_fr, tt_rl, tt_rr),
+            ers_store_j=ers / ERS_STORE_SCALE,
+            mguk_power_w=mguk / MGUK_POWER_SCALE,
+            fuel_flow_rate_kg_h=fuel / FUEL_FLOW_SCALE
         )
     
     def get_packet_size_bytes(self) -> int:
-        return len(self.to_udp_bytes())
+        return PACKET_SIZE_BYTES
     
     def is_critical(self) -> bool:
         return (self.brake_percent > 0.95 or 
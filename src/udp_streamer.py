@@ -1,11 +1,311 @@
+import bisect
+from collections import deque
+import ctypes
+import ctypes.util
+import errno
+import os
+import queue
+import select
 import socket
+import struct
+import sys
+import threading
 import time
-from collections import deque
-import statistics
 
 from data_source import F1DataSource
+from latency_histogram import LatencyHistogram
 from config import *
 
+class _Iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_Iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _Msghdr), ('msg_len', ctypes.c_uint)]
+
+class _SendmmsgBatcher:
+    # hands a whole batch of datagrams to the kernel in one sendmmsg() call
+    # headers, iovecs and one slab of UDP_PACKET_SIZE slots are allocated once;
+    # a flush copies the packets into the slab and never builds ctypes objects
+    # the socket is connected, so headers carry no msg_name
+    def __init__(self, sock: socket.socket, max_batch: int = MAX_SEND_BATCH):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._sendmmsg = libc.sendmmsg
+        self._sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+        self._sendmmsg.restype = ctypes.c_int
+        self._fd = sock.fileno()
+        self._max_batch = max_batch
+        
+        self._slab = ctypes.create_string_buffer(max_batch * UDP_PACKET_SIZE)
+        self._base = ctypes.addressof(self._slab)
+        self._iov = (_Iovec * max_batch)()
+        self._msgs = (_Mmsghdr * max_batch)()
+        self._msgs_addr = ctypes.addressof(self._msgs)
+        self._layout = None
+        self._set_layout(UDP_PACKET_SIZE)
+        for i in range(max_batch):
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iov[i])
+            hdr.msg_iovlen = 1
+    
+    def _set_layout(self, size: int):
+        # iovec i covers bytes [i * size, (i + 1) * size) of the slab
+        if size != self._layout:
+            for i, iov in enumerate(self._iov):
+                iov.iov_base = self._base + i * size
+                iov.iov_len = size
+            self._layout = size
+    
+    def send(self, packets: list) -> int:
+        # returns how many of packets went out, the rest hit a full socket buffer
+        # the slab and headers hold max_batch packets, longer lists go out in chunks
+        max_batch = self._max_batch
+        if len(packets) <= max_batch:
+            return self._send_chunk(packets)
+        
+        sent = 0
+        for i in range(0, len(packets), max_batch):
+            chunk = packets[i:i + max_batch]
+            n = self._send_chunk(chunk)
+            sent += n
+            if n < len(chunk):
+                break
+        return sent
+    
+    def _send_chunk(self, packets: list) -> int:
+        size = len(packets[0])
+        
+        if size <= UDP_PACKET_SIZE and all(len(p) == size for p in packets):
+            # fixed size packets, the joined bytes are the slab contents as is
+            data = b''.join(packets)
+            self._set_layout(size)
+            ctypes.memmove(self._base, data, len(data))
+        else:
+            self._set_layout(UDP_PACKET_SIZE)
+            for i, packet_bytes in enumerate(packets):
+                if len(packet_bytes) > UDP_PACKET_SIZE:
+                    raise ValueError(f"packet of {len(packet_bytes)}B exceeds UDP_PACKET_SIZE")
+                ctypes.memmove(self._base + i * UDP_PACKET_SIZE, packet_bytes, len(packet_bytes))
+                self._iov[i].iov_len = len(packet_bytes)
+            # iov_len no longer matches any layout, the next flush sets one again
+            self._layout = None
+        
+        sent = 0
+        while sent < len(packets):
+            n = self._sendmmsg(self._fd, self._msgs_addr + sent * ctypes.sizeof(_Mmsghdr),
+                               len(packets) - sent, 0)
+            if n < 0:
+                err = ctypes.get_errno()
+                if err == errno.ECONNREFUSED:
+                    # ICMP from an earlier datagram with no receiver listening,
+                    # reported once on a connected socket; the batch itself can go
+                    continue
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise OSError(err, os.strerror(err))
+            sent += n
+        return sent
+
+class _SendtoBatcher:
+    # fallback where sendmmsg is unavailable, one send per packet
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+    
+    def send(self, packets: list) -> int:
+        send = self._sock.send
+        for sent, packet_bytes in enumerate(packets):
+            try:
+                send(packet_bytes)
+            except ConnectionRefusedError:
+                # earlier datagram refused, the error is cleared once reported
+                try:
+                    send(packet_bytes)
+                except BlockingIOError:
+                    return sent
+            except BlockingIOError:
+                return sent
+        return len(packets)
+
+_SOL_UDP = getattr(socket, 'SOL_UDP', 17)
+_UDP_SEGMENT = getattr(socket, 'UDP_SEGMENT', 103)
+_UDP_MAX_SEGMENTS = 64  # kernel limit per GSO send
+
+class _GsoBatcher:
+    # UDP generic segmentation offload: equal sized packets go out as one buffer in
+    # one sendmsg() with a UDP_SEGMENT cmsg, the kernel splits it into datagrams
+    # mixed sizes are handed to the wrapped batcher
+    def __init__(self, sock: socket.socket, fallback):
+        sock.getsockopt(_SOL_UDP, _UDP_SEGMENT)  # raises where the kernel has no GSO
+        self._sock = sock
+        self._fallback = fallback
+        self._segment_cmsg = {}  # packet size -> ancillary data
+        self._enabled = True  # cleared for good if the egress device refuses GSO
+    
+    def send(self, packets: list) -> int:
+        # returns how many of packets went out, the rest hit a full socket buffer
+        size = len(packets[0])
+        if not self._enabled or not all(len(p) == size for p in packets):
+            return self._fallback.send(packets)
+        data = b''.join(packets)
+        
+        cmsg = self._segment_cmsg.get(size)
+        if cmsg is None:
+            cmsg = self._segment_cmsg[size] = [(_SOL_UDP, _UDP_SEGMENT, struct.pack('=H', size))]
+        
+        view = memoryview(data)
+        sendmsg = self._sock.sendmsg
+        sent = 0
+        while sent < len(packets):
+            chunk = view[sent * size:(sent + _UDP_MAX_SEGMENTS) * size]
+            try:
+                sendmsg([chunk], cmsg)
+            except ConnectionRefusedError:
+                # earlier datagram refused, the error is cleared once reported
+                continue
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno != errno.EIO:
+                    raise
+                # no TX checksum offload on the egress device, which the getsockopt
+                # probe cannot see; the rest of the session goes through the fallback
+                print("[WARN] UDP GSO refused by the device, falling back to sendmmsg")
+                self._enabled = False
+                return sent + self._fallback.send(packets[sent:])
+            sent += len(chunk) // size
+        return sent
+
+_SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+def _tune_socket(sock: socket.socket):
+    # best effort, the stream works with kernel defaults when a knob is refused
+    # SO_ZEROCOPY only pays off for sends of ~10KB and up, not 43B datagrams, and
+    # SO_TXTIME needs an etf qdisc on the interface; pacing stays with the timerfd
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF_BYTES)
+    except OSError as e:
+        print(f"[WARN] Could not set SO_SNDBUF: {e}")
+    
+    if sys.platform.startswith('linux') and SOCKET_BUSY_POLL_US:
+        try:
+            # busy poll spins on the rx queue, it does nothing for the sends on this socket
+            # raising it above net.core.busy_poll needs CAP_NET_ADMIN, EPERM is expected without it
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, SOCKET_BUSY_POLL_US)
+        except OSError as e:
+            if e.errno != errno.EPERM:
+                print(f"[WARN] Could not set SO_BUSY_POLL: {e}")
+
+def _make_batcher(sock: socket.socket):
+    batcher = _SendtoBatcher(sock)
+    if sys.platform.startswith('linux'):
+        try:
+            batcher = _SendmmsgBatcher(sock)
+        except (OSError, AttributeError):
+            pass
+        
+        if USE_UDP_GSO:
+            try:
+                batcher = _GsoBatcher(sock, batcher)
+            except OSError:
+                pass
+    return batcher
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [('it_interval', _Timespec), ('it_value', _Timespec)]
+
+_CLOCK_MONOTONIC = 1
+_TFD_CLOEXEC = 0o2000000
+_TFD_TIMER_ABSTIME = 1
+
+class _TimerfdTimer:
+    # periodic kernel timer on an absolute CLOCK_MONOTONIC schedule, no drift from
+    # wakeup latency; wait() returns how many ticks expired since the last wait
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._settime = libc.timerfd_settime
+        self._settime.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Itimerspec), ctypes.c_void_p]
+        self._settime.restype = ctypes.c_int
+        
+        self._fd = libc.timerfd_create(_CLOCK_MONOTONIC, _TFD_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = self._fd  # readable when a tick has expired
+        self.deadline = 0.0  # next tick, time.monotonic() seconds
+    
+    def arm(self, interval_s: float):
+        interval_ns = int(interval_s * 1_000_000_000)
+        first_ns = time.clock_gettime_ns(time.CLOCK_MONOTONIC) + interval_ns
+        spec = _Itimerspec(
+            _Timespec(*divmod(interval_ns, 1_000_000_000)),
+            _Timespec(*divmod(first_ns, 1_000_000_000)),
+        )
+        if self._settime(self._fd, _TFD_TIMER_ABSTIME, ctypes.byref(spec), None) < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._interval_s = interval_s
+        self.deadline = first_ns / 1_000_000_000
+    
+    def wait(self) -> int:
+        expirations = int.from_bytes(os.read(self._fd, 8), sys.byteorder)
+        self.deadline += expirations * self._interval_s
+        return expirations
+    
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self.fd = None
+
+class _SleepTimer:
+    # same absolute schedule with time.sleep, where timerfd is unavailable
+    def __init__(self):
+        self.fd = None
+        self.deadline = 0.0
+    
+    def arm(self, interval_s: float):
+        self._interval_s = interval_s
+        self._start = time.monotonic()
+        self._ticks = 0
+        self.deadline = self._start + interval_s
+    
+    def wait(self) -> int:
+        now = time.monotonic()
+        if now < self.deadline:
+            time.sleep(self.deadline - now)
+            now = time.monotonic()
+        expirations = max(int((now - self._start) / self._interval_s) - self._ticks, 1)
+        self._ticks += expirations
+        self.deadline = self._start + (self._ticks + 1) * self._interval_s
+        return expirations
+    
+    def close(self):
+        pass
+
+def _make_timer():
+    if sys.platform.startswith('linux'):
+        try:
+            return _TimerfdTimer()
+        except (OSError, AttributeError):
+            pass
+    return _SleepTimer()
+
+# queued by the producer thread after the last batch
+_END_OF_STREAM = object()
+
 class UDPTelemetryStreamer:
     def __init__(self, target_ip: str = '127.0.0.1', target_port: int = UDP_PORT):
         self.target_ip = target_ip
@@ -14,27 +314,52 @@ class UDPTelemetryStreamer:
         
         # socket to non-blocking for low latency
         self.socket.setblocking(0)
+        _tune_socket(self.socket)
+        
+        # fixed destination, connected once so sends skip per-call address handling
+        self.socket.connect((target_ip, target_port))
+        
+        # packets queued for the next sendmmsg and their enqueue times (perf_counter_ns)
+        self._batcher = _make_batcher(self.socket)
+        self._pending = []
+        self._pending_times = []
+        self._next_metrics_at = BASE_FREQUENCY_HZ
+        self._packet_size = None
+        
+        # realtime pacing, armed when the first packet goes out
+        self._timer = _make_timer()
         
         # matrix
         self.packets_sent = 0
         self.packets_dropped = 0
         self.bytes_sent = 0
-        self.start_time = None
+        self.start_time_ns = None  # time.monotonic_ns(), immune to wall clock steps
         self.current_lap = 0
         self.total_laps = 0
         
         # latency tracking
-        self.latencies_us = deque(maxlen=1000)  # microseconds
+        # microseconds saturating at uint16 range, reset every metrics tick
+        self.latency_hist = LatencyHistogram(highest_value=LATENCY_SATURATION_US)
+        self.dropped_overlimit = 0  # latencies past the histogram range, whole session
+        
+        # (packet_id, microseconds, reason) recorded on the send path, printed by _print_metrics
+        self._warn_ring = deque(maxlen=WARN_RING_SIZE)
+        self._warn_count = 0
         
         print(f"[UDP] Streamer initialized -> {target_ip}:{target_port}")
         print("[UDP] Simulating telemetry")
         print(f"[UDP] Target: {BASE_FREQUENCY_HZ}Hz, <{MAX_LATENCY_MS}ms latency")
+        print(f"[UDP] Send buffer: {self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) // 1024}KB")
     
     def stream_session(self, data_source: F1DataSource, realtime: bool = True):
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         packet_interval_s = PACKET_INTERVAL_MS / 1000.0
+        flush_slack_s = SEND_FLUSH_SLACK_US / 1_000_000
         
         self.total_laps = data_source.total_laps
+        
+        # fixed size wire packets let bytes_sent skip len() per packet, None means variable
+        self._packet_size = getattr(data_source, 'packet_size', None)
 
         print("\n[UDP] Starting telemetry stream")
         print(f"[UDP] Streaming {self.total_laps} lap(s)")
@@ -42,70 +367,237 @@ class UDPTelemetryStreamer:
         print(f"[UDP] Max latency: {MAX_LATENCY_MS}ms")
         print(f"[UDP] Packet interval: {PACKET_INTERVAL_MS:.1f}ms")
         
-        last_packet_time = time.perf_counter()
         first_packet = True
+        ticks_ready = 0
+        backlog = 0  # packets left queued after the socket buffer filled
+        lag_ticks = int(MAX_LATENCY_MS / PACKET_INTERVAL_MS)
+        self._next_metrics_at = BASE_FREQUENCY_HZ
         
-        for packet in data_source.generate_packets(realtime=realtime):
-            # skip timing check for 1st packet (init overhead)
-            if first_packet:
-                last_packet_time = time.perf_counter()
-                self.start_time = time.time()
-                first_packet = False
-            
-            # measure send latency
-            send_start = time.perf_counter()
-            
-            packet_bytes = packet.to_udp_bytes() # compact binary format
-            
-            try:
-                # send packet (non-blocking)
-                self.socket.sendto(packet_bytes, (self.target_ip, self.target_port))
-                
-                # latency in microseconds
-                send_latency_us = (time.perf_counter() - send_start) * 1_000_000
-                self.latencies_us.append(send_latency_us)
-                
-                # check exceed latency requirement
-                if send_latency_us > MAX_LATENCY_MS * 1000:
-                    self.packets_dropped += 1
-                    print(f"[WARN] Packet {packet.packet_id} dropped - "f"latency {send_latency_us/1000:.2f}ms > {MAX_LATENCY_MS}ms limit")
-                
-                self.packets_sent += 1
-                self.bytes_sent += len(packet_bytes)
-                
-            except BlockingIOError:
-                # socket buffer full -> packet loss
-                self.packets_dropped += 1
-                print(f"[WARN] Packet {packet.packet_id} dropped - buffer full")
-            
-            if realtime and not first_packet:  # skip for first packet
-                target_time = last_packet_time + packet_interval_s
-                current_time = time.perf_counter()
-                
-                if current_time < target_time:
-                    time.sleep(target_time - current_time) # maintaining freq
-                elif current_time > target_time + (MAX_LATENCY_MS / 1000):
-                    # too far behind
-                    lag_ms = (current_time - target_time) * 1000
-                    print(f"[CRITICAL] Stream lagging by {lag_ms:.1f}ms - "f"would drop packets!")
-                
-                last_packet_time = time.perf_counter()
+        packet_id = 0
+        last_lap = 0
+        lap_start_packet = 0
+        report_laps = hasattr(data_source, 'print_lap_start')
+        
+        # hot loop names bound once as locals
+        pending = self._pending
+        queue_packet = pending.append
+        queue_time = self._pending_times.append
+        perf_ns = time.perf_counter_ns
+        monotonic = time.monotonic
+        timer = self._timer
+        wait_tick = timer.wait
+        flush = self._flush
+        max_batch = MAX_SEND_BATCH
+        
+        for batch, lap, lap_time in self._prefetch_batches(data_source, realtime):
+            # lap output follows the send loop, not the producer running ahead of it
+            if lap != last_lap:
+                if report_laps:
+                    if last_lap > 0:
+                        # everything queued so far belongs to the finished lap
+                        backlog = flush(packet_id, keep_unsent=realtime)
+                        data_source.print_lap_complete(last_lap, packet_id - lap_start_packet)
+                    data_source.print_lap_start(lap, lap_time)
+                last_lap = lap
+                lap_start_packet = packet_id
             
             # track current lap
-            if hasattr(data_source, 'current_lap'):
-                self.current_lap = data_source.current_lap
+            self.current_lap = lap
             
-            if self.packets_sent % BASE_FREQUENCY_HZ == 0:
-                self._print_metrics()
+            for packet_bytes in batch:
+                # skip timing check for 1st packet (init overhead)
+                if first_packet:
+                    # schedule is absolute from here, tick i at start + i * interval
+                    if realtime:
+                        timer.arm(packet_interval_s)
+                    self.start_time_ns = time.monotonic_ns()
+                    first_packet = False
+                
+                # queued with its enqueue time, latency runs until the flush returns
+                queue_packet(packet_bytes)
+                queue_time(perf_ns())
+                packet_id += 1
                 
+                if realtime:
+                    # each packet after the first takes one timer tick, ticks that
+                    # expired while we were busy are spent without waiting
+                    if ticks_ready == 0:
+                        # flush now unless the next tick is due within the slack
+                        if len(pending) >= max_batch or timer.deadline - monotonic() > flush_slack_s:
+                            backlog = flush(packet_id, keep_unsent=True)
+                        
+                        # maintaining freq, retrying a backlog whenever the socket drains
+                        ticks_ready = self._wait_tick(packet_id) if backlog else wait_tick()
+                        backlog = 0
+                        if ticks_ready > lag_ticks:
+                            # too far behind, missed ticks are counted instead of drifting
+                            self._warn(packet_id, (ticks_ready - 1) * PACKET_INTERVAL_MS * 1000, 'lag')
+                    ticks_ready -= 1
+                    
+                    if len(pending) >= max_batch:
+                        backlog = flush(packet_id, keep_unsent=True)
+                elif len(pending) >= max_batch:
+                    flush(packet_id)
+        
+        flush(packet_id)
+        self._drain_warnings()
+        
+        if report_laps and packet_id:
+            data_source.print_stream_complete(last_lap, packet_id - lap_start_packet,
+                                              packet_id / BASE_FREQUENCY_HZ)
+    
+    def _prefetch_batches(self, data_source: F1DataSource, realtime: bool):
+        # packing and lap bookkeeping run on a producer thread into a bounded queue,
+        # the send loop only takes ready batches; yields (batch, lap of the batch, lap time)
+        batches = queue.Queue(maxsize=PREFETCH_BATCHES)
+        stop = threading.Event()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            # capability checked once, not per batch
+            track_lap = hasattr(data_source, 'current_lap')
+            try:
+                for batch in data_source.generate_packet_batches(realtime=realtime):
+                    if track_lap:
+                        lap, lap_time = data_source.current_lap, getattr(data_source, 'current_lap_time', None)
+                    else:
+                        lap, lap_time = self.current_lap, None
+                    if not put((batch, lap, lap_time)):
+                        return
+                put(_END_OF_STREAM)
+            except BaseException as e:
+                # re-raised on the send thread
+                put(e)
+        
+        producer = threading.Thread(target=produce, name='packet-producer', daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join(timeout=1.0)
+    
+    def _wait_tick(self, next_packet_id: int) -> int:
+        # one select on the timer and socket writability: a drained socket buffer
+        # retries the backlog, the timer firing ends the wait
+        timer = self._timer
+        backlog = True
+        while backlog:
+            if timer.fd is not None:
+                ready, _, _ = select.select([timer.fd], [self.socket], [])
+            else:
+                timeout = max(timer.deadline - time.monotonic(), 0)
+                _, writable, _ = select.select([], [self.socket], [], timeout)
+                ready = not writable
+            if ready:
+                break
+            backlog = self._flush(next_packet_id, keep_unsent=True)
+        return timer.wait()
+    
+    def _flush(self, next_packet_id: int, keep_unsent: bool = False) -> int:
+        # queued packets are consecutive, the last one is next_packet_id - 1
+        # counters are updated once per flush, only latency is handled per packet
+        # keep_unsent leaves packets refused by a full socket buffer queued (up to
+        # a batch less one) for a retry instead of dropping them; returns how many
+        pending = self._pending
+        if not pending:
+            return 0
+        
+        sent = self._batcher.send(pending)
+        sent_at_ns = time.perf_counter_ns()
+        queued_times = self._pending_times
+        first_id = next_packet_id - len(pending)
+        
+        record_latency = self.latency_hist.record_value
+        max_latency_us = MAX_LATENCY_MS * 1000
+        
+        # latency in whole microseconds, integer math throughout; only every
+        # LATENCY_SAMPLE_EVERY-th packet id is recorded, the metrics are quantiles
+        for queued_at_ns in queued_times[(-first_id) % LATENCY_SAMPLE_EVERY:sent:LATENCY_SAMPLE_EVERY]:
+            record_latency((sent_at_ns - queued_at_ns) // 1000)
+        
+        # check exceed latency requirement for every packet; enqueue times ascend, so the
+        # late packets are a prefix and one bisect counts them without a compare per packet
+        late = bisect.bisect_right(queued_times, sent_at_ns - (max_latency_us + 1) * 1000, 0, sent)
+        
+        if late:
+            # rare path, find which packets were late
+            for packet_id, queued_at_ns in enumerate(queued_times[:sent], first_id):
+                send_latency_us = (sent_at_ns - queued_at_ns) // 1000
+                if send_latency_us > max_latency_us:
+                    self._warn(packet_id, send_latency_us, 'latency')
+        
+        unsent = len(pending) - sent
+        kept = min(unsent, MAX_SEND_BATCH - 1) if keep_unsent else 0
+        
+        # socket buffer full -> packet loss, the oldest go first
+        for packet_id in range(first_id + sent, next_packet_id - kept):
+            self._warn(packet_id, 0, 'buffer')
+        
+        self.packets_dropped += unsent - kept + late
+        self.packets_sent += sent
+        if self._packet_size:
+            self.bytes_sent += sent * self._packet_size
+        else:
+            self.bytes_sent += sum(map(len, pending[:sent]))
+        
+        del pending[:len(pending) - kept]
+        del queued_times[:len(queued_times) - kept]
+        
+        if self.packets_sent >= self._next_metrics_at:
+            self._print_metrics()
+            self._next_metrics_at += BASE_FREQUENCY_HZ
+        return kept
+    
+    def _warn(self, packet_id: int, value_us: float, reason: str):
+        # no stdout writes on the send path, a burst of drops would only add latency
+        self._warn_ring.append((packet_id, value_us, reason))
+        self._warn_count += 1
+    
+    def _drain_warnings(self):
+        shown = 0
+        while self._warn_ring and shown < WARN_PRINT_LIMIT:
+            packet_id, value_us, reason = self._warn_ring.popleft()
+            if reason == 'latency':
+                print(f"[WARN] Packet {packet_id} dropped - "f"latency {value_us/1000:.2f}ms > {MAX_LATENCY_MS}ms limit")
+            elif reason == 'buffer':
+                print(f"[WARN] Packet {packet_id} dropped - buffer full")
+            else:
+                lag_ms = value_us / 1000
+                print(f"[CRITICAL] Stream lagging by {lag_ms:.1f}ms ({lag_ms / PACKET_INTERVAL_MS:.0f} missed ticks) "f"at packet {packet_id} - would drop packets!")
+            shown += 1
+        
+        if self._warn_count > shown:
+            print(f"[WARN] {self._warn_count - shown} more warning(s) suppressed")
+        self._warn_ring.clear()
+        self._warn_count = 0
+    
     def _print_metrics(self):
-        elapsed = time.time() - self.start_time
+        self._drain_warnings()
+        
+        elapsed = (time.monotonic_ns() - self.start_time_ns) / 1e9
         pps = self.packets_sent / elapsed
         mbps = (self.bytes_sent * 8) / (elapsed * 1_000_000)
         
-        if self.latencies_us:
-            avg_latency_us = statistics.mean(self.latencies_us)
-            p99_latency_us = sorted(self.latencies_us)[int(len(self.latencies_us) * 0.99)]
+        if self.latency_hist.total_count:
+            avg_latency_us = self.latency_hist.get_mean_value()
+            p99_latency_us = self.latency_hist.get_value_at_percentile(99)
+            self.dropped_overlimit += self.latency_hist.saturated_count
+            self.latency_hist.reset()
             
             # milisicond conversion
             avg_latency_ms = avg_latency_us / 1000 
@@ -124,6 +616,8 @@ class UDPTelemetryStreamer:
         print(f"  Avg latency: {avg_latency_ms:.3f}ms")
         print(f"  P99 latency: {p99_latency_ms:.3f}ms (limit: {MAX_LATENCY_MS}ms)")
         print(f"  Packet loss: {packet_loss_rate:.2f}% ({self.packets_dropped} dropped)")
+        if self.dropped_overlimit:
+            print(f"  Over {LATENCY_SATURATION_US / 1000:.1f}ms: {self.dropped_overlimit} (recorded as {LATENCY_SATURATION_US / 1000:.1f}ms)")
         
         if p99_latency_ms > MAX_LATENCY_MS:
             print("  !!  WARNING: P99 latency exceeds requirement!")
@@ -132,5 +626,6 @@ class UDPTelemetryStreamer:
     
     def close(self):
         self.socket.close()
+        self._timer.close()
         print("\n[UDP] Streamer closed")
         print(f"[UDP] Final stats: {self.packets_sent:,} sent, {self.packets_dropped} dropped")
\ No newline at end of file